@@ -0,0 +1,146 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Compiled REST2v5 kernel.
+
+Same fused elementwise formulation as the numba kernel in
+clearSkyRadiation_REST2v5: both bands are computed per (station, time) pixel
+entirely in registers over the flattened grid, parallelized across pixels
+with OpenMP. Built optionally by setup.py; when the extension is missing the
+model falls back to the numba or NumPy paths.
+"""
+from cython.parallel import prange
+from libc.math cimport cos, exp, fabs, log, pow, sqrt
+
+
+def rest2_core(double[::1] zenith_angle, double[::1] Eext, double[::1] pressure,
+               double[::1] water_vapour, double[::1] ozone, double[::1] nitrogen_dioxide,
+               double[::1] AOD550, double[::1] Angstrom_exponent, double[::1] surface_albedo,
+               double[::1] ghi, double[::1] dni, double[::1] dhi):
+    cdef Py_ssize_t i, n = zenith_angle.shape[0]
+    cdef double z, z_deg, z_cap, cos_z
+    cdef double alph, p, w, uo, un, rg, ab
+    cdef double ama, amw, amo, amR, amRe
+    cdef double TR1, Tg1, f1, f2, f3, To1, g1, g2, g3, Tn1, Tn1166, h1, h2, Tw1, Tw1166
+    cdef double d0, d1, d2, d3, ua1, lam1, ta1, TA1, TAS1, BR1, p0, p1, p2, F1, rs1
+    cdef double TR2, Tg2, c1, c2, c3, c4, Tw2, Tw2166, e0, e1, e2, e3, lam2, ta2
+    cdef double TA2, TAS2, Ba, q0, q1, q2, F2, rs2
+    cdef double E0n1, Ebn1, Edp1, Edd1, E0n2, Ebn2, Edp2, Edd2, dni_i, dhi_i, ghi_i
+
+    with nogil:
+        for i in prange(n, schedule='static'):
+            z = zenith_angle[i]
+            z_deg = z * 57.29577951308232
+            z_cap = 89.9 if z_deg > 89.9 else z_deg
+            cos_z = cos(z)
+
+            # clamp with NaN-propagating conditionals: C fmin/fmax would
+            # replace a NaN input (missing MERRA2 data) with the clip bound,
+            # while NaN must survive to the final >= 0 QC so the pixel zeroes
+            # out like on the NumPy and numba paths
+            alph = Angstrom_exponent[i]
+            alph = 0. if alph < 0. else (2.5 if alph > 2.5 else alph)
+            p = pressure[i]
+            p = 300. if p < 300. else (1100. if p > 1100. else p)
+            w = water_vapour[i]
+            w = 0. if w < 0. else (10. if w > 10. else w)
+            uo = ozone[i]
+            uo = 0. if uo < 0. else (0.6 if uo > 0.6 else uo)
+            un = nitrogen_dioxide[i]
+            un = 0. if un < 0. else (0.03 if un > 0.03 else un)
+            rg = surface_albedo[i]
+            rg = 0. if rg < 0. else (1. if rg > 1. else rg)
+
+            # air masses
+            ama = 1. / (cos_z + 0.16851 * pow(z_cap, 0.18198) / pow(95.318 - z_cap, 1.9542))
+            amw = 1. / (cos_z + 0.10648 * pow(z_cap, 0.11423) / pow(93.781 - z_cap, 1.9203))
+            amo = 1. / (cos_z + 1.0651 * pow(z_cap, 0.6379) / pow(101.8 - z_cap, 2.2694))
+            amR = 1. / (cos_z + 0.48353 * pow(z_cap, 0.095846) / pow(96.741 - z_cap, 1.754))
+            amRe = (p / 1013.25) * amR
+
+            # Angstrom turbidity
+            ab = AOD550[i] / pow(0.55, -alph)
+            ab = 0. if ab < 0. else (1.1 if ab > 1.1 else ab)
+
+            # Band 1
+            TR1 = (1 + 1.8169 * amRe - 0.033454 * amRe * amRe) / (1 + 2.063 * amRe + 0.31978 * amRe * amRe)
+            Tg1 = (1 + 0.95885 * amRe + 0.012871 * amRe * amRe) / (1 + 0.96321 * amRe + 0.015455 * amRe * amRe)
+            f1 = uo * (10.979 - 8.5421 * uo) / (1 + 2.0115 * uo + 40.189 * uo * uo)
+            f2 = uo * (-0.027589 - 0.005138 * uo) / (1 - 2.4857 * uo + 13.942 * uo * uo)
+            f3 = uo * (10.995 - 5.5001 * uo) / (1 + 1.6784 * uo + 42.406 * uo * uo)
+            To1 = (1 + f1 * amo + f2 * amo * amo) / (1 + f3 * amo)
+            g1 = (0.17499 + 41.654 * un - 2146.4 * un * un) / (1 + 22295. * un * un)
+            g2 = un * (-1.2134 + 59.324 * un) / (1 + 8847.8 * un * un)
+            g3 = (0.17499 + 61.658 * un + 9196.4 * un * un) / (1 + 74109. * un * un)
+            Tn1 = (1 + g1 * amw + g2 * amw * amw) / (1 + g3 * amw)
+            Tn1 = 1. if Tn1 > 1. else Tn1
+            Tn1166 = (1 + g1 * 1.66 + g2 * 1.66 * 1.66) / (1 + g3 * 1.66)
+            Tn1166 = 1. if Tn1166 > 1. else Tn1166
+            h1 = w * (0.065445 + 0.00029901 * w) / (1 + 1.2728 * w)
+            h2 = w * (0.065687 + 0.0013218 * w) / (1 + 1.2008 * w)
+            Tw1 = (1 + h1 * amw) / (1 + h2 * amw)
+            Tw1166 = (1 + h1 * 1.66) / (1 + h2 * 1.66)
+            d0 = 0.57664 - 0.024743 * alph
+            d1 = (0.093942 - 0.2269 * alph + 0.12848 * alph * alph) / (1 + 0.6418 * alph)
+            d2 = (-0.093819 + 0.36668 * alph - 0.12775 * alph * alph) / (1 - 0.11651 * alph)
+            d3 = alph * (0.15232 - 0.087214 * alph + 0.012664 * alph * alph) / (
+                    1 - 0.90454 * alph + 0.26167 * alph * alph)
+            ua1 = log(1 + ama * ab)
+            lam1 = (d0 + d1 * ua1 + d2 * ua1 * ua1) / (1 + d3 * ua1 * ua1)
+            ta1 = fabs(ab * pow(lam1, -alph))
+            TA1 = exp(-ama * ta1)
+            TAS1 = pow(TA1, 0.92)
+            BR1 = 0.5 * (0.89013 - 0.0049558 * amR + 0.000045721 * amR * amR)
+            p0 = (3.715 + 0.368 * ama + 0.036294 * ama * ama) / (1 + 0.0009391 * ama * ama)
+            p1 = (-0.164 - 0.72567 * ama + 0.20701 * ama * ama) / (1 + 0.0019012 * ama * ama)
+            p2 = (-0.052288 + 0.31902 * ama + 0.17871 * ama * ama) / (1 + 0.0069592 * ama * ama)
+            F1 = (p0 + p1 * ta1) / (1 + p2 * ta1)
+            rs1 = (0.13363 + 0.00077358 * alph + ab * (0.37567 + 0.22946 * alph) / (1 - 0.10832 * alph)) / (
+                    1 + ab * (0.84057 + 0.68683 * alph) / (1 - 0.08158 * alph))
+
+            # Band 2
+            TR2 = (1 - 0.010394 * amRe) / (1 - 0.00011042 * amRe * amRe)
+            Tg2 = (1 + 0.27284 * amRe - 0.00063699 * amRe * amRe) / (1 + 0.30306 * amRe)
+            c1 = w * (19.566 - 1.6506 * w + 1.0672 * w * w) / (1 + 5.4248 * w + 1.6005 * w * w)
+            c2 = w * (0.50158 - 0.14732 * w + 0.047584 * w * w) / (1 + 1.1811 * w + 1.0699 * w * w)
+            c3 = w * (21.286 - 0.39232 * w + 1.2692 * w * w) / (1 + 4.8318 * w + 1.412 * w * w)
+            c4 = w * (0.70992 - 0.23155 * w + 0.096514 * w * w) / (1 + 0.44907 * w + 0.75425 * w * w)
+            Tw2 = (1 + c1 * amw + c2 * amw * amw) / (1 + c3 * amw + c4 * amw * amw)
+            Tw2166 = (1 + c1 * 1.66 + c2 * 1.66 * 1.66) / (1 + c3 * 1.66 + c4 * 1.66 * 1.66)
+            e0 = (1.183 - 0.022989 * alph + 0.020829 * alph * alph) / (1 + 0.11133 * alph)
+            e1 = (-0.50003 - 0.18329 * alph + 0.23835 * alph * alph) / (1 + 1.6756 * alph)
+            e2 = (-0.50001 + 1.1414 * alph + 0.0083589 * alph * alph) / (1 + 11.168 * alph)
+            e3 = (-0.70003 - 0.73587 * alph + 0.51509 * alph * alph) / (1 + 4.7665 * alph)
+            lam2 = (e0 + e1 * ua1 + e2 * ua1 * ua1) / (1 + e3 * ua1)
+            ta2 = ab * pow(fabs(lam2), -alph)
+            TA2 = exp(-ama * ta2)
+            TAS2 = pow(TA2, 0.84)
+            Ba = 1 - exp(-0.6931 - 1.8326 * cos_z)
+            q0 = (3.4352 + 0.65267 * ama + 0.00034328 * ama * ama) / (1 + 0.034388 * pow(ama, 1.5))
+            q1 = (1.231 - 1.63853 * ama + 0.20667 * ama * ama) / (1 + 0.1451 * pow(ama, 1.5))
+            q2 = (0.8889 - 0.55063 * ama + 0.50152 * ama * ama) / (1 + 0.14865 * pow(ama, 1.5))
+            F2 = (q0 + q1 * ta2) / (1 + q2 * ta2)
+            rs2 = (0.010191 + 0.00085547 * alph + ab * (0.14618 + 0.062758 * alph) / (1 - 0.19402 * alph)) / (
+                    1 + ab * (0.58101 + 0.17426 * alph) / (1 - 0.17586 * alph))
+
+            # irradiances
+            E0n1 = Eext[i] * 0.46512
+            Ebn1 = E0n1 * TR1 * Tg1 * To1 * Tn1 * Tw1 * TA1
+            Edp1 = E0n1 * cos_z * To1 * Tg1 * Tn1166 * Tw1166 * (
+                    BR1 * (1 - TR1) * sqrt(sqrt(TA1)) + Ba * F1 * TR1 * (1 - sqrt(sqrt(TAS1))))
+            Edd1 = rg * rs1 * (Ebn1 * cos_z + Edp1) / (1 - rg * rs1)
+            E0n2 = Eext[i] * 0.51951
+            Ebn2 = E0n2 * TR2 * Tg2 * Tw2 * TA2
+            Edp2 = E0n2 * cos_z * Tg2 * Tw2166 * (
+                    0.5 * (1 - TR2) * sqrt(sqrt(TA2)) + Ba * F2 * TR2 * (1 - sqrt(sqrt(TAS2))))
+            Edd2 = rg * rs2 * (Ebn2 * cos_z + Edp2) / (1 - rg * rs2)
+
+            dni_i = Ebn1 + Ebn2
+            dhi_i = Edp1 + Edd1 + Edp2 + Edd2
+            if z_deg > 90:
+                dni_i = 0.
+                dhi_i = 0.
+            ghi_i = dni_i * cos_z + dhi_i
+            # quality control: negatives and NaNs go to zero
+            ghi[i] = ghi_i if ghi_i >= 0 else 0.
+            dni[i] = dni_i if dni_i >= 0 else 0.
+            dhi[i] = dhi_i if dhi_i >= 0 else 0.
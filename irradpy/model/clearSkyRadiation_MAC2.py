@@ -18,7 +18,7 @@ class ClearSkyMAC2:
         station_num = np.size(lat)
         self.lat = lat.reshape([station_num, ])
         self.lon = lon.reshape([station_num, ])
-        self.elev = elev.reshape([station_num, 1])
+        self.elev = np.ascontiguousarray(elev).reshape(station_num, 1)
         self.time = time
         self.datadir = datadir
         self.pandas_output = pandas
@@ -186,11 +186,13 @@ class ClearSkyMAC2:
                                                   surface_albedo, Eext, components)
             if self.pandas_output:
                 col_index = ['GHI', 'DNI', 'DIF']
+                # one contiguous (station, time, component) block; every frame
+                # below is a no-copy view into it instead of a per-station hstack
+                stacked = np.stack((Egh.T, Edn.T, Edh.T), axis=-1)
                 station_data_list = []
                 for index in range(len(self.time)):
-                    time_temp = (self.time[index]).reshape(self.time[index].size, 1)
-                    row_index = time_temp[:, 0]
-                    station_data = pd.DataFrame(np.hstack((Egh[:, index][:, np.newaxis], Edn[:, index][:, np.newaxis], Edh[:, index][:, np.newaxis])), index=row_index, columns=col_index)
+                    row_index = np.ravel(self.time[index])
+                    station_data = pd.DataFrame(stacked[index], index=row_index, columns=col_index, copy=False)
                     station_data_list.append(station_data)
 
                 return station_data_list
@@ -1,13 +1,158 @@
+import math
 import numpy as np
 import os
-import warnings
 from ..extractor.extract import extract_dataset_list, extract_dataset, extract_for_MERRA2
 from .solarGeometry import *
 import pandas as pd
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    from . import _rest2_core
+except ImportError:
+    _rest2_core = None
+
+if numba is not None:
+    # fastmath is restricted to flags that keep IEEE NaN/inf comparison
+    # semantics: the input clips and the final >= 0 quality control are what
+    # zero out invalid pixels, and nnan/ninf would make them undefined
+    @numba.njit(parallel=True, fastmath={'contract', 'arcp', 'reassoc'}, cache=True)
+    def _rest2_kernel(zenith_angle, Eext, pressure, water_vapour, ozone, nitrogen_dioxide,
+                      AOD550, Angstrom_exponent, surface_albedo, ghi, dni, dhi):
+        """
+        Fused elementwise REST2v5 kernel over flattened input arrays.
+
+        Computes both bands for one (station, time) pixel entirely in registers,
+        so the ~60 grid-sized intermediate arrays of the NumPy formulation never
+        materialize. Same formulas and clipping as the NumPy fallback in
+        ClearSkyREST2v5.clear_sky_REST2V5.
+        """
+        for i in numba.prange(zenith_angle.size):
+            z = zenith_angle[i]
+            z_deg = math.degrees(z)
+            z_cap = min(z_deg, 89.9)
+            cos_z = math.cos(z)
+
+            alph = min(max(Angstrom_exponent[i], 0.), 2.5)
+            p = min(max(pressure[i], 300.), 1100.)
+            w = min(max(water_vapour[i], 0.), 10.)
+            uo = min(max(ozone[i], 0.), 0.6)
+            un = min(max(nitrogen_dioxide[i], 0.), 0.03)
+            rg = min(max(surface_albedo[i], 0.), 1.)
+
+            # air masses
+            ama = 1. / (cos_z + 0.16851 * z_cap ** 0.18198 / (95.318 - z_cap) ** 1.9542)
+            amw = 1. / (cos_z + 0.10648 * z_cap ** 0.11423 / (93.781 - z_cap) ** 1.9203)
+            amo = 1. / (cos_z + 1.0651 * z_cap ** 0.6379 / (101.8 - z_cap) ** 2.2694)
+            amR = 1. / (cos_z + 0.48353 * z_cap ** 0.095846 / (96.741 - z_cap) ** 1.754)
+            amRe = (p / 1013.25) * amR
+
+            # Angstrom turbidity
+            ab = min(max(AOD550[i] / 0.55 ** -alph, 0.), 1.1)
+
+            # Band 1
+            TR1 = (1 + 1.8169 * amRe - 0.033454 * amRe * amRe) / (1 + 2.063 * amRe + 0.31978 * amRe * amRe)
+            Tg1 = (1 + 0.95885 * amRe + 0.012871 * amRe * amRe) / (1 + 0.96321 * amRe + 0.015455 * amRe * amRe)
+            f1 = uo * (10.979 - 8.5421 * uo) / (1 + 2.0115 * uo + 40.189 * uo * uo)
+            f2 = uo * (-0.027589 - 0.005138 * uo) / (1 - 2.4857 * uo + 13.942 * uo * uo)
+            f3 = uo * (10.995 - 5.5001 * uo) / (1 + 1.6784 * uo + 42.406 * uo * uo)
+            To1 = (1 + f1 * amo + f2 * amo * amo) / (1 + f3 * amo)
+            g1 = (0.17499 + 41.654 * un - 2146.4 * un * un) / (1 + 22295. * un * un)
+            g2 = un * (-1.2134 + 59.324 * un) / (1 + 8847.8 * un * un)
+            g3 = (0.17499 + 61.658 * un + 9196.4 * un * un) / (1 + 74109. * un * un)
+            # expression first: min keeps its first argument on an unordered
+            # comparison, so a NaN from missing data survives to the final QC
+            Tn1 = min((1 + g1 * amw + g2 * amw * amw) / (1 + g3 * amw), 1.)
+            Tn1166 = min((1 + g1 * 1.66 + g2 * 1.66 * 1.66) / (1 + g3 * 1.66), 1.)
+            h1 = w * (0.065445 + 0.00029901 * w) / (1 + 1.2728 * w)
+            h2 = w * (0.065687 + 0.0013218 * w) / (1 + 1.2008 * w)
+            Tw1 = (1 + h1 * amw) / (1 + h2 * amw)
+            Tw1166 = (1 + h1 * 1.66) / (1 + h2 * 1.66)
+            d0 = 0.57664 - 0.024743 * alph
+            d1 = (0.093942 - 0.2269 * alph + 0.12848 * alph * alph) / (1 + 0.6418 * alph)
+            d2 = (-0.093819 + 0.36668 * alph - 0.12775 * alph * alph) / (1 - 0.11651 * alph)
+            d3 = alph * (0.15232 - 0.087214 * alph + 0.012664 * alph * alph) / (
+                    1 - 0.90454 * alph + 0.26167 * alph * alph)
+            ua1 = math.log(1 + ama * ab)
+            lam1 = (d0 + d1 * ua1 + d2 * ua1 * ua1) / (1 + d3 * ua1 * ua1)
+            ta1 = abs(ab * lam1 ** -alph)
+            TA1 = math.exp(-ama * ta1)
+            TAS1 = TA1 ** 0.92
+            BR1 = 0.5 * (0.89013 - 0.0049558 * amR + 0.000045721 * amR * amR)
+            p0 = (3.715 + 0.368 * ama + 0.036294 * ama * ama) / (1 + 0.0009391 * ama * ama)
+            p1 = (-0.164 - 0.72567 * ama + 0.20701 * ama * ama) / (1 + 0.0019012 * ama * ama)
+            p2 = (-0.052288 + 0.31902 * ama + 0.17871 * ama * ama) / (1 + 0.0069592 * ama * ama)
+            F1 = (p0 + p1 * ta1) / (1 + p2 * ta1)
+            rs1 = (0.13363 + 0.00077358 * alph + ab * (0.37567 + 0.22946 * alph) / (1 - 0.10832 * alph)) / (
+                    1 + ab * (0.84057 + 0.68683 * alph) / (1 - 0.08158 * alph))
+
+            # Band 2
+            TR2 = (1 - 0.010394 * amRe) / (1 - 0.00011042 * amRe * amRe)
+            Tg2 = (1 + 0.27284 * amRe - 0.00063699 * amRe * amRe) / (1 + 0.30306 * amRe)
+            c1 = w * (19.566 - 1.6506 * w + 1.0672 * w * w) / (1 + 5.4248 * w + 1.6005 * w * w)
+            c2 = w * (0.50158 - 0.14732 * w + 0.047584 * w * w) / (1 + 1.1811 * w + 1.0699 * w * w)
+            c3 = w * (21.286 - 0.39232 * w + 1.2692 * w * w) / (1 + 4.8318 * w + 1.412 * w * w)
+            c4 = w * (0.70992 - 0.23155 * w + 0.096514 * w * w) / (1 + 0.44907 * w + 0.75425 * w * w)
+            Tw2 = (1 + c1 * amw + c2 * amw * amw) / (1 + c3 * amw + c4 * amw * amw)
+            Tw2166 = (1 + c1 * 1.66 + c2 * 1.66 * 1.66) / (1 + c3 * 1.66 + c4 * 1.66 * 1.66)
+            e0 = (1.183 - 0.022989 * alph + 0.020829 * alph * alph) / (1 + 0.11133 * alph)
+            e1 = (-0.50003 - 0.18329 * alph + 0.23835 * alph * alph) / (1 + 1.6756 * alph)
+            e2 = (-0.50001 + 1.1414 * alph + 0.0083589 * alph * alph) / (1 + 11.168 * alph)
+            e3 = (-0.70003 - 0.73587 * alph + 0.51509 * alph * alph) / (1 + 4.7665 * alph)
+            lam2 = (e0 + e1 * ua1 + e2 * ua1 * ua1) / (1 + e3 * ua1)
+            ta2 = ab * abs(lam2) ** -alph
+            TA2 = math.exp(-ama * ta2)
+            TAS2 = TA2 ** 0.84
+            Ba = 1 - math.exp(-0.6931 - 1.8326 * cos_z)
+            q0 = (3.4352 + 0.65267 * ama + 0.00034328 * ama * ama) / (1 + 0.034388 * ama ** 1.5)
+            q1 = (1.231 - 1.63853 * ama + 0.20667 * ama * ama) / (1 + 0.1451 * ama ** 1.5)
+            q2 = (0.8889 - 0.55063 * ama + 0.50152 * ama * ama) / (1 + 0.14865 * ama ** 1.5)
+            F2 = (q0 + q1 * ta2) / (1 + q2 * ta2)
+            rs2 = (0.010191 + 0.00085547 * alph + ab * (0.14618 + 0.062758 * alph) / (1 - 0.19402 * alph)) / (
+                    1 + ab * (0.58101 + 0.17426 * alph) / (1 - 0.17586 * alph))
+
+            # irradiances
+            E0n1 = Eext[i] * 0.46512
+            Ebn1 = E0n1 * TR1 * Tg1 * To1 * Tn1 * Tw1 * TA1
+            Edp1 = E0n1 * cos_z * To1 * Tg1 * Tn1166 * Tw1166 * (
+                    BR1 * (1 - TR1) * math.sqrt(math.sqrt(TA1)) + Ba * F1 * TR1 * (1 - math.sqrt(math.sqrt(TAS1))))
+            Edd1 = rg * rs1 * (Ebn1 * cos_z + Edp1) / (1 - rg * rs1)
+            E0n2 = Eext[i] * 0.51951
+            Ebn2 = E0n2 * TR2 * Tg2 * Tw2 * TA2
+            Edp2 = E0n2 * cos_z * Tg2 * Tw2166 * (
+                    0.5 * (1 - TR2) * math.sqrt(math.sqrt(TA2)) + Ba * F2 * TR2 * (1 - math.sqrt(math.sqrt(TAS2))))
+            Edd2 = rg * rs2 * (Ebn2 * cos_z + Edp2) / (1 - rg * rs2)
+
+            dni_i = Ebn1 + Ebn2
+            dhi_i = Edp1 + Edd1 + Edp2 + Edd2
+            if z_deg > 90:
+                dni_i = 0.
+                dhi_i = 0.
+            ghi_i = dni_i * cos_z + dhi_i
+            # quality control: negatives and NaNs go to zero
+            ghi[i] = ghi_i if ghi_i >= 0 else 0.
+            dni[i] = dni_i if dni_i >= 0 else 0.
+            dhi[i] = dhi_i if dhi_i >= 0 else 0.
+else:
+    _rest2_kernel = None
+
+
 class ClearSkyREST2v5:
 
-    def __init__(self, lat: np.ndarray, lon: np.ndarray, elev, time, datadir, pandas=True):
+    def __init__(self, lat: np.ndarray, lon: np.ndarray, elev, time, datadir, pandas=True,
+                 dtype=np.float64):
+        """
+        lat/lon/elev are kept as views of the caller's arrays where possible;
+        reshaping only copies when an input is not contiguous.
+        """
         if lat.shape != lon.shape:
             raise Exception('lat and lon not match...')
         if np.max(np.abs(lat)) > 90:
@@ -18,16 +163,22 @@ class ClearSkyREST2v5:
         station_num = np.size(lat)
         self.lat = lat.reshape([station_num, ])
         self.lon = lon.reshape([station_num, ])
-        self.elev = elev.reshape([station_num, 1])
+        self.elev = np.ascontiguousarray(elev).reshape(station_num, 1)
         self.time = time
         self.datadir = datadir
         self.pandas_output = pandas
+        # np.float32 halves memory traffic and doubles SIMD width; plenty of
+        # precision for MERRA2 inputs quantized to a few significant figures
+        self.dtype = np.dtype(dtype)
+        # (fingerprint, (zenith_angle, Eext)) from the last REST2v5() run
+        self._geom_cache = None
 
     def clear_sky_REST2V5(self, zenith_angle: np.ndarray, Eext: np.ndarray, pressure: np.ndarray,
                          water_vapour: np.ndarray,
                          ozone: np.ndarray, nitrogen_dioxide: np.ndarray, AOD550: np.ndarray,
                          Angstrom_exponent: np.ndarray,
-                         surface_albedo: np.ndarray):
+                         surface_albedo: np.ndarray,
+                         ghi: np.ndarray = None, dni: np.ndarray = None, dhi: np.ndarray = None):
         """
         Input requirements
 
@@ -55,210 +206,261 @@ class ClearSkyREST2v5:
 
         you can run this model with your arguments manually, but recommend run model by rest2() automatically with
         arguments by default.
+
+        ghi/dni/dhi may be passed as preallocated output buffers (all three
+        together, or none); results are then written in place, which lets
+        callers such as the chunked REST2v5 driver avoid one copy per chunk.
+        C-contiguous buffers are written directly, others through a scratch
+        copy.
         """
-        warnings.filterwarnings("ignore")
-        Angstrom_exponent[Angstrom_exponent > 2.5] = 2.5
-        Angstrom_exponent[Angstrom_exponent < 0] = 0
-        pressure[pressure > 1100] = 1100
-        pressure[pressure < 300] = 300
-        water_vapour[water_vapour > 10] = 10
-        water_vapour[water_vapour < 0] = 0
-        ozone[ozone > 0.6] = 0.6
-        ozone[ozone < 0] = 0
-        nitrogen_dioxide[nitrogen_dioxide > 0.03] = 0.03
-        nitrogen_dioxide[nitrogen_dioxide < 0] = 0
-        surface_albedo[surface_albedo > 1] = 1
-        surface_albedo[surface_albedo < 0] = 0
-
-        # air mass for aerosols extinction
-        complex_temp = np.array(zenith_angle * 180. / np.pi, dtype=np.complex)
-
-        ama = np.abs(np.power(np.cos(zenith_angle) + 0.16851 * np.power(complex_temp, 0.18198) / np.power(
-            95.318 - complex_temp, 1.9542), -1))
-        # air mass for water vapor absorption
-        amw = np.abs(np.power(np.cos(zenith_angle) + 0.10648 * np.power(complex_temp, 0.11423) / np.power(
-            93.781 - complex_temp, 1.9203), -1))
-        # air mass for nitrogen dioxide absorption
-        # amn = np.abs(np.power(np.cos(zenith_angle) + 1.1212 * np.power(zenith_angle * 180. / np.pi, 1.6132) / np.power(
-        #   3.2629 - zenith_angle * 180. / np.pi, 1.9203), -1))
-        # air mass for ozone absorption
-        amo = np.abs(np.power(np.cos(zenith_angle) + 1.0651 * np.power(complex_temp, 0.6379) / np.power(
-            101.8 - complex_temp, 2.2694), -1))
-        # air mass for Rayleigh scattering and uniformly mixed gases absorption
-        amR = np.abs(np.power(np.cos(zenith_angle) + 0.48353 * np.power(complex_temp, 0.095846) / np.power(
-            96.741 - complex_temp, 1.754), -1))
-        amRe = np.abs((pressure / 1013.25) * np.power(
-            np.cos(zenith_angle) + 0.48353 * (np.power(complex_temp, 0.095846)) / np.power(
-                96.741 - complex_temp, 1.754), -1))
-
-        # Angstrom turbidity
-        ang_beta = AOD550 / np.power(0.55, -1 * Angstrom_exponent)
-        ang_beta[ang_beta > 1.1] = 1.1
-        ang_beta[ang_beta < 0] = 0
-
-        '''Band 1'''
-
-        # transmittance for Rayleigh scattering
-        TR1 = (1 + 1.8169 * amRe - 0.033454 * np.power(amRe, 2)) / (1 + 2.063 * amRe + 0.31978 * np.power(amRe, 2))
-        # transmittance for uniformly mixed gases absorption
-        Tg1 = (1 + 0.95885 * amRe + 0.012871 * np.power(amRe, 2)) / (1 + 0.96321 * amRe + 0.015455 * np.power(amRe, 2))
-        # transmittance for Ozone absorption
-        uo = ozone
-        f1 = uo * (10.979 - 8.5421 * uo) / (1 + 2.0115 * uo + 40.189 * np.power(uo, 2))
-        f2 = uo * (-0.027589 - 0.005138 * uo) / (1 - 2.4857 * uo + 13.942 * np.power(uo, 2))
-        f3 = uo * (10.995 - 5.5001 * uo) / (1 + 1.6784 * uo + 42.406 * np.power(uo, 2))
-        To1 = (1 + f1 * amo + f2 * np.power(amo, 2)) / (1 + f3 * amo)
-        # transmittance for Nitrogen dioxide absorption
-        un = nitrogen_dioxide
-        g1 = (0.17499 + 41.654 * un - 2146.4 * np.power(un, 2)) / (1 + 22295. * np.power(un, 2))
-        g2 = un * (-1.2134 + 59.324 * un) / (1 + 8847.8 * np.power(un, 2))
-        g3 = (0.17499 + 61.658 * un + 9196.4 * np.power(un, 2)) / (1 + 74109. * np.power(un, 2))
-        Tn1_middle = ((1 + g1 * amw + g2 * np.power(amw, 2)) / (1 + g3 * amw))
-        Tn1_middle[Tn1_middle > 1] = 1
-        Tn1 = Tn1_middle
-        # Tn1 = min(1, ((1 + g1 * amw + g2 * np.power(amw, 2)) / (1 + g3 * amw)))
-        Tn1166_middle = (1 + g1 * 1.66 + g2 * np.power(1.66, 2)) / (1 + g3 * 1.66)
-        Tn1166_middle[Tn1166_middle > 1] = 1
-        Tn1166 = Tn1166_middle
-        # Tn1166 = min(1, ((1 + g1 * 1.66 + g2 * np.power(1.66, 2)) / (1 + g3 * 1.66)))  # atairmass = 1.66
-        # transmittance for Water Vapor absorption
-        h1 = water_vapour * (0.065445 + 0.00029901 * water_vapour) / (1 + 1.2728 * water_vapour)
-        h2 = water_vapour * (0.065687 + 0.0013218 * water_vapour) / (1 + 1.2008 * water_vapour)
-        Tw1 = (1 + h1 * amw) / (1 + h2 * amw)
-        Tw1166 = (1 + h1 * 1.66) / (1 + h2 * 1.66)  # atairmass = 1.66
-
-        # coefficients of angstrom_alpha
-        AB1 = ang_beta
-        alph1 = Angstrom_exponent
-        d0 = 0.57664 - 0.024743 * alph1
-        d1 = (0.093942 - 0.2269 * alph1 + 0.12848 * np.power(alph1, 2)) / (1 + 0.6418 * alph1)
-        d2 = (-0.093819 + 0.36668 * alph1 - 0.12775 * np.power(alph1, 2)) / (1 - 0.11651 * alph1)
-        d3 = alph1 * (0.15232 - 0.087214 * alph1 + 0.012664 * np.power(alph1, 2)) / (
-                1 - 0.90454 * alph1 + 0.26167 * np.power(alph1, 2))
-        ua1 = np.log(1 + ama * AB1)
-        lam1 = (d0 + d1 * ua1 + d2 * np.power(ua1, 2)) / (1 + d3 * np.power(ua1, 2))
-
-        # Aeroso transmittance
-        ta1 = np.abs(AB1 * np.power(lam1, -1 * alph1))
-        TA1 = np.exp(-ama * ta1)
-
-        # Aeroso scattering transmittance
-        TAS1 = np.exp(-ama * 0.92 * ta1)  # w1 = 0.92recommended
-
-        # forward scattering fractions for Rayleigh extinction
-        BR1 = 0.5 * (0.89013 - 0.0049558 * amR + 0.000045721 * np.power(amR, 2))
-
-        # Aerosol scattering correction factor
-        g0 = (3.715 + 0.368 * ama + 0.036294 * np.power(ama, 2)) / (1 + 0.0009391 * np.power(ama, 2))
-        g1 = (-0.164 - 0.72567 * ama + 0.20701 * np.power(ama, 2)) / (1 + 0.0019012 * np.power(ama, 2))
-        g2 = (-0.052288 + 0.31902 * ama + 0.17871 * np.power(ama, 2)) / (1 + 0.0069592 * np.power(ama, 2))
-        F1 = (g0 + g1 * ta1) / (1 + g2 * ta1)
-
-        # sky albedo
-        rs1 = (0.13363 + 0.00077358 * alph1 + AB1 * (0.37567 + 0.22946 * alph1) / (1 - 0.10832 * alph1)) / (
-                1 + AB1 * (0.84057 + 0.68683 * alph1) / (1 - 0.08158 * alph1))
-        # ground albedo
-        rg = surface_albedo
-
-        '''Band 2'''
-
-        # transmittance for Rayleigh scattering
-        TR2 = (1 - 0.010394 * amRe) / (1 - 0.00011042 * np.power(amRe, 2))
-        # transmittance for uniformly mixed gases absorption
-        Tg2 = (1 + 0.27284 * amRe - 0.00063699 * np.power(amRe, 2)) / (1 + 0.30306 * amRe)
-        # transmittance for Ozone absorption
-        To2 = 1  # Ozone (none)
-        # transmittance for Nitrogen dioxide absorption
-        Tn2 = 1  # Nitrogen (none)
-        Tn2166 = 1  # at air mass=1.66
-
-        # transmittance for water vapor  absorption
-        c1 = water_vapour * (19.566 - 1.6506 * water_vapour + 1.0672 * np.power(water_vapour, 2)) / (
-                1 + 5.4248 * water_vapour + 1.6005 * np.power(water_vapour, 2))
-        c2 = water_vapour * (0.50158 - 0.14732 * water_vapour + 0.047584 * np.power(water_vapour, 2)) / (
-                1 + 1.1811 * water_vapour + 1.0699 * np.power(water_vapour, 2))
-        c3 = water_vapour * (21.286 - 0.39232 * water_vapour + 1.2692 * np.power(water_vapour, 2)) / (
-                1 + 4.8318 * water_vapour + 1.412 * np.power(water_vapour, 2))
-        c4 = water_vapour * (0.70992 - 0.23155 * water_vapour + 0.096514 * np.power(water_vapour, 2)) / (
-                1 + 0.44907 * water_vapour + 0.75425 * np.power(water_vapour, 2))
-        Tw2 = (1 + c1 * amw + c2 * np.power(amw, 2)) / (1 + c3 * amw + c4 * np.power(amw, 2))
-        Tw2166 = (1 + c1 * 1.66 + c2 * np.power(1.66, 2)) / (1 + c3 * 1.66 + c4 * np.power(1.66, 2))
-
-        # coefficients of angstrom_alpha
-        AB2 = ang_beta
-        alph2 = Angstrom_exponent
-        e0 = (1.183 - 0.022989 * alph2 + 0.020829 * np.power(alph2, 2)) / (1 + 0.11133 * alph2)
-        e1 = (-0.50003 - 0.18329 * alph2 + 0.23835 * np.power(alph2, 2)) / (1 + 1.6756 * alph2)
-        e2 = (-0.50001 + 1.1414 * alph2 + 0.0083589 * np.power(alph2, 2)) / (1 + 11.168 * alph2)
-        e3 = (-0.70003 - 0.73587 * alph2 + 0.51509 * np.power(alph2, 2)) / (1 + 4.7665 * alph2)
-        ua2 = np.log(1 + ama * AB2)
-        lam2 = (e0 + e1 * ua2 + e2 * np.power(ua2, 2)) / (1 + e3 * ua2)
-
-        # Aeroso transmittance
-        lam2_temp = np.array(lam2, dtype=np.complex)
-        ta2 = np.abs(AB2 * np.power(lam2_temp, -1 * alph2))
-        TA2 = np.exp(-1 * ama * ta2)
-        TAS2 = np.exp(-1 * ama * 0.84 * ta2)  # w2=0.84 recommended
-
-        # forward scattering fractions for Rayleigh extinction
-        BR2 = 0.5  # multi scatter negibile in Band 2
-        # the aerosol forward scatterance factor
-        Ba = 1 - np.exp(-0.6931 - 1.8326 * np.cos(zenith_angle))
-
-        # Aerosol scattering correction
-        h0 = (3.4352 + 0.65267 * ama + 0.00034328 * np.power(ama, 2)) / (1 + 0.034388 * np.power(ama, 1.5))
-        h1 = (1.231 - 1.63853 * ama + 0.20667 * np.power(ama, 2)) / (1 + 0.1451 * np.power(ama, 1.5))
-        h2 = (0.8889 - 0.55063 * ama + 0.50152 * np.power(ama, 2)) / (1 + 0.14865 * np.power(ama, 1.5))
-        F2 = (h0 + h1 * ta2) / (1 + h2 * ta2)
-
-        # sky albedo
-        rs2 = (0.010191 + 0.00085547 * alph2 + AB2 * (0.14618 + 0.062758 * alph2) / (1 - 0.19402 * alph2)) / (
-                1 + AB2 * (0.58101 + 0.17426 * alph2) / (1 - 0.17586 * alph2))
-
-        # irradiance BAND1
-        E0n1 = Eext * 0.46512
-        # direct beam irradiance
-        Ebn1 = E0n1 * TR1 * Tg1 * To1 * Tn1 * Tw1 * TA1
-
-        # the incident diffuse irradiance on a perfectly absorbing ground
-        Edp1 = E0n1 * np.cos(zenith_angle) * To1 * Tg1 * Tn1166 * Tw1166 * (
-                BR1 * (1 - TR1) * np.power(TA1, 0.25) + Ba * F1 * TR1 * (1 - np.power(TAS1, 0.25)))
-        # multiple reflections between the ground and the atmosphere
-        Edd1 = rg * rs1 * (Ebn1 * np.cos(zenith_angle) + Edp1) / (1 - rg * rs1)
-
-        # irradiance BAND2
-        E0n2 = Eext * 0.51951
-        # direct beam irradiance
-        Ebn2 = E0n2 * TR2 * Tg2 * To2 * Tn2 * Tw2 * TA2
-        # the incident diffuse irradiance on a perfectly absorbing ground
-        Edp2 = E0n2 * np.cos(zenith_angle) * To2 * Tg2 * Tn2166 * Tw2166 * (
-                BR2 * (1 - TR2) * np.power(TA2, 0.25) + Ba * F2 * TR2 * (1 - np.power(TAS2, 0.25)))
-        # multiple reflections between the ground and the atmosphere
-        Edd2 = rg * rs2 * (Ebn2 * np.cos(zenith_angle) + Edp2) / (1 - rg * rs2)
-        # TOTALS BAND1+BAND2
-        # direct horizontal irradiance
-        Ebh = (Ebn1 + Ebn2) * np.cos(zenith_angle)
-        dni = Ebn1 + Ebn2
-        # correct for zenith angle
-        dni[np.rad2deg(zenith_angle) > 90] = 0
-        Ebh[np.rad2deg(zenith_angle) > 90] = 0
-        # diffuse horizontal irradiance
-
-        dhi = Edp1 + Edd1 + Edp2 + Edd2
-        dhi[np.rad2deg(zenith_angle) > 90] = 0
-
-        # global horizontal irradiance
-        ghi = Ebh + dhi
-
-        # Quality Control
-        lower = 0
-        ghi[ghi < lower] = np.nan
-        dni[dni < lower] = np.nan
-        dhi[dhi < lower] = np.nan
-
-        ghi[np.isnan(ghi)] = 0
-        dni[np.isnan(dni)] = 0
-        dhi[np.isnan(dhi)] = 0
+        dtype = self.dtype
+        if dtype != np.float64:
+            zenith_angle = zenith_angle.astype(dtype, copy=False)
+            Eext = Eext.astype(dtype, copy=False)
+            pressure = pressure.astype(dtype, copy=False)
+            water_vapour = water_vapour.astype(dtype, copy=False)
+            ozone = ozone.astype(dtype, copy=False)
+            nitrogen_dioxide = nitrogen_dioxide.astype(dtype, copy=False)
+            AOD550 = AOD550.astype(dtype, copy=False)
+            Angstrom_exponent = Angstrom_exponent.astype(dtype, copy=False)
+            surface_albedo = surface_albedo.astype(dtype, copy=False)
+
+        if ghi is None and dni is None and dhi is None:
+            ghi = np.empty(zenith_angle.shape, dtype=dtype)
+            dni = np.empty(zenith_angle.shape, dtype=dtype)
+            dhi = np.empty(zenith_angle.shape, dtype=dtype)
+        elif ghi is None or dni is None or dhi is None:
+            raise Exception('pass ghi, dni and dhi output buffers together or not at all...')
+
+        # the compiled Cython extension only handles float64 buffers
+        core = _rest2_core if dtype == np.float64 else None
+        if core is not None or _rest2_kernel is not None:
+            # fused elementwise kernel: one pass over the grid instead of ~60
+            # full-size intermediate arrays; the compiled Cython extension is
+            # preferred over the jitted kernel when it was built
+            flat_args = [np.ravel(np.asarray(arg, dtype=dtype)) for arg in
+                         (zenith_angle, Eext, pressure, water_vapour, ozone,
+                          nitrogen_dioxide, AOD550, Angstrom_exponent, surface_albedo)]
+            # reshape(-1) on a non-C-contiguous buffer would copy and the
+            # kernel would write into the copy; such buffers get a scratch
+            # array whose results are written back below
+            flat_outs = [out.reshape(-1) if out.flags['C_CONTIGUOUS']
+                         else np.empty(out.size, dtype=out.dtype)
+                         for out in (ghi, dni, dhi)]
+            if core is not None:
+                core.rest2_core(*flat_args, *flat_outs)
+            else:
+                _rest2_kernel(*flat_args, *flat_outs)
+            for out, flat in zip((ghi, dni, dhi), flat_outs):
+                if not out.flags['C_CONTIGUOUS']:
+                    out[...] = flat.reshape(out.shape)
+            return [ghi, dni, dhi]
+
+        # invalid/divide/overflow pop up transiently for below-horizon
+        # pixels; those are masked or zeroed before returning
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            np.clip(Angstrom_exponent, 0, 2.5, out=Angstrom_exponent)
+            np.clip(pressure, 300, 1100, out=pressure)
+            np.clip(water_vapour, 0, 10, out=water_vapour)
+            np.clip(ozone, 0, 0.6, out=ozone)
+            np.clip(nitrogen_dioxide, 0, 0.03, out=nitrogen_dioxide)
+            np.clip(surface_albedo, 0, 1, out=surface_albedo)
+
+            # degrees and cosine of the zenith angle, computed once and reused;
+            # z_cap is capped below the horizon so the air mass formulas stay real
+            # valued (those pixels are zeroed out at the end anyway)
+            z_deg = zenith_angle * 57.29577951308232  # 180/pi; skips the rad2deg ufunc dispatch
+            z_cap = np.minimum(z_deg, 89.9)
+            cos_z = np.cos(zenith_angle)
+
+            # air mass for aerosols extinction
+            ama = 1. / (cos_z + 0.16851 * np.power(z_cap, 0.18198) / np.power(95.318 - z_cap, 1.9542))
+            # air mass for water vapor absorption
+            amw = 1. / (cos_z + 0.10648 * np.power(z_cap, 0.11423) / np.power(93.781 - z_cap, 1.9203))
+            # air mass for nitrogen dioxide absorption
+            # amn = 1. / (cos_z + 1.1212 * np.power(z_cap, 1.6132) / np.power(3.2629 - z_cap, 1.9203))
+            # air mass for ozone absorption
+            amo = 1. / (cos_z + 1.0651 * np.power(z_cap, 0.6379) / np.power(101.8 - z_cap, 2.2694))
+            # air mass for Rayleigh scattering and uniformly mixed gases absorption
+            amR = 1. / (cos_z + 0.48353 * np.power(z_cap, 0.095846) / np.power(96.741 - z_cap, 1.754))
+            amRe = (pressure / 1013.25) * amR
+
+            # powers of the air masses reused throughout both bands
+            amRe2 = amRe * amRe
+            ama2 = ama * ama
+            ama15 = ama * np.sqrt(ama)
+
+            # Angstrom turbidity
+            ang_beta = AOD550 / np.power(0.55, -1 * Angstrom_exponent)
+            np.clip(ang_beta, 0, 1.1, out=ang_beta)
+
+            '''Band 1'''
+
+            # transmittance for Rayleigh scattering
+            TR1 = (1 + amRe * (1.8169 - 0.033454 * amRe)) / (1 + amRe * (2.063 + 0.31978 * amRe))
+            # transmittance for uniformly mixed gases absorption
+            Tg1 = (1 + amRe * (0.95885 + 0.012871 * amRe)) / (1 + amRe * (0.96321 + 0.015455 * amRe))
+            # transmittance for Ozone absorption
+            uo = ozone
+            f1 = uo * (10.979 - 8.5421 * uo) / (1 + uo * (2.0115 + 40.189 * uo))
+            f2 = uo * (-0.027589 - 0.005138 * uo) / (1 - uo * (2.4857 - 13.942 * uo))
+            f3 = uo * (10.995 - 5.5001 * uo) / (1 + uo * (1.6784 + 42.406 * uo))
+            To1 = (1 + amo * (f1 + f2 * amo)) / (1 + f3 * amo)
+            # transmittance for Nitrogen dioxide absorption
+            un = nitrogen_dioxide
+            g1 = (0.17499 + un * (41.654 - 2146.4 * un)) / (1 + 22295. * (un * un))
+            g2 = un * (-1.2134 + 59.324 * un) / (1 + 8847.8 * (un * un))
+            g3 = (0.17499 + un * (61.658 + 9196.4 * un)) / (1 + 74109. * (un * un))
+            Tn1_middle = ((1 + amw * (g1 + g2 * amw)) / (1 + g3 * amw))
+            np.minimum(Tn1_middle, 1, out=Tn1_middle)
+            Tn1 = Tn1_middle
+            # Tn1 = min(1, ((1 + amw * (g1 + g2 * amw)) / (1 + g3 * amw)))
+            Tn1166_middle = (1 + g1 * 1.66 + g2 * np.power(1.66, 2)) / (1 + g3 * 1.66)
+            np.minimum(Tn1166_middle, 1, out=Tn1166_middle)
+            Tn1166 = Tn1166_middle
+            # Tn1166 = min(1, ((1 + g1 * 1.66 + g2 * np.power(1.66, 2)) / (1 + g3 * 1.66)))  # atairmass = 1.66
+            # transmittance for Water Vapor absorption
+            h1 = water_vapour * (0.065445 + 0.00029901 * water_vapour) / (1 + 1.2728 * water_vapour)
+            h2 = water_vapour * (0.065687 + 0.0013218 * water_vapour) / (1 + 1.2008 * water_vapour)
+            Tw1 = (1 + h1 * amw) / (1 + h2 * amw)
+            Tw1166 = (1 + h1 * 1.66) / (1 + h2 * 1.66)  # atairmass = 1.66
+
+            # coefficients of angstrom_alpha
+            AB1 = ang_beta
+            alph1 = Angstrom_exponent
+            d0 = 0.57664 - 0.024743 * alph1
+            d1 = (0.093942 - alph1 * (0.2269 - 0.12848 * alph1)) / (1 + 0.6418 * alph1)
+            d2 = (-0.093819 + alph1 * (0.36668 - 0.12775 * alph1)) / (1 - 0.11651 * alph1)
+            d3 = alph1 * (0.15232 - alph1 * (0.087214 - 0.012664 * alph1)) / (
+                    1 - alph1 * (0.90454 - 0.26167 * alph1))
+            ua1 = np.log(1 + ama * AB1)
+            lam1 = (d0 + ua1 * (d1 + d2 * ua1)) / (1 + d3 * (ua1 * ua1))
+
+            # Aeroso transmittance
+            ta1 = np.abs(AB1 * np.power(lam1, -1 * alph1))
+            TA1 = np.exp(-ama * ta1)
+
+            # Aeroso scattering transmittance
+            TAS1 = np.power(TA1, 0.92)  # w1 = 0.92recommended; exp(-0.92*ama*ta1) == TA1**0.92
+
+            # forward scattering fractions for Rayleigh extinction
+            BR1 = 0.5 * (0.89013 - amR * (0.0049558 - 0.000045721 * amR))
+
+            # Aerosol scattering correction factor
+            g0 = (3.715 + ama * (0.368 + 0.036294 * ama)) / (1 + 0.0009391 * ama2)
+            g1 = (-0.164 - ama * (0.72567 - 0.20701 * ama)) / (1 + 0.0019012 * ama2)
+            g2 = (-0.052288 + ama * (0.31902 + 0.17871 * ama)) / (1 + 0.0069592 * ama2)
+            F1 = (g0 + g1 * ta1) / (1 + g2 * ta1)
+
+            # sky albedo
+            rs1 = (0.13363 + 0.00077358 * alph1 + AB1 * (0.37567 + 0.22946 * alph1) / (1 - 0.10832 * alph1)) / (
+                    1 + AB1 * (0.84057 + 0.68683 * alph1) / (1 - 0.08158 * alph1))
+            # ground albedo
+            rg = surface_albedo
+
+            '''Band 2'''
+
+            # transmittance for Rayleigh scattering
+            TR2 = (1 - 0.010394 * amRe) / (1 - 0.00011042 * amRe2)
+            # transmittance for uniformly mixed gases absorption
+            Tg2 = (1 + amRe * (0.27284 - 0.00063699 * amRe)) / (1 + 0.30306 * amRe)
+            # transmittance for Ozone absorption
+            To2 = 1  # Ozone (none)
+            # transmittance for Nitrogen dioxide absorption
+            Tn2 = 1  # Nitrogen (none)
+            Tn2166 = 1  # at air mass=1.66
+
+            # transmittance for water vapor  absorption
+            c1 = water_vapour * (19.566 - water_vapour * (1.6506 - 1.0672 * water_vapour)) / (
+                    1 + water_vapour * (5.4248 + 1.6005 * water_vapour))
+            c2 = water_vapour * (0.50158 - water_vapour * (0.14732 - 0.047584 * water_vapour)) / (
+                    1 + water_vapour * (1.1811 + 1.0699 * water_vapour))
+            c3 = water_vapour * (21.286 - water_vapour * (0.39232 - 1.2692 * water_vapour)) / (
+                    1 + water_vapour * (4.8318 + 1.412 * water_vapour))
+            c4 = water_vapour * (0.70992 - water_vapour * (0.23155 - 0.096514 * water_vapour)) / (
+                    1 + water_vapour * (0.44907 + 0.75425 * water_vapour))
+            Tw2 = (1 + amw * (c1 + c2 * amw)) / (1 + amw * (c3 + c4 * amw))
+            Tw2166 = (1 + c1 * 1.66 + c2 * np.power(1.66, 2)) / (1 + c3 * 1.66 + c4 * np.power(1.66, 2))
+
+            # coefficients of angstrom_alpha
+            AB2 = ang_beta
+            alph2 = Angstrom_exponent
+            e0 = (1.183 - alph2 * (0.022989 - 0.020829 * alph2)) / (1 + 0.11133 * alph2)
+            e1 = (-0.50003 - alph2 * (0.18329 - 0.23835 * alph2)) / (1 + 1.6756 * alph2)
+            e2 = (-0.50001 + alph2 * (1.1414 + 0.0083589 * alph2)) / (1 + 11.168 * alph2)
+            e3 = (-0.70003 - alph2 * (0.73587 - 0.51509 * alph2)) / (1 + 4.7665 * alph2)
+            ua2 = np.log(1 + ama * AB2)
+            lam2 = (e0 + ua2 * (e1 + e2 * ua2)) / (1 + e3 * ua2)
+
+            # Aeroso transmittance
+            # |lam2 ** -alph2| == |lam2| ** -alph2, so no complex detour is needed
+            ta2 = AB2 * np.power(np.abs(lam2), -1 * alph2)
+            TA2 = np.exp(-ama * ta2)
+            TAS2 = np.power(TA2, 0.84)  # w2=0.84 recommended; exp(-0.84*ama*ta2) == TA2**0.84
+
+            # forward scattering fractions for Rayleigh extinction
+            BR2 = 0.5  # multi scatter negibile in Band 2
+            # the aerosol forward scatterance factor
+            Ba = 1 - np.exp(-0.6931 - 1.8326 * cos_z)
+
+            # Aerosol scattering correction
+            h0 = (3.4352 + ama * (0.65267 + 0.00034328 * ama)) / (1 + 0.034388 * ama15)
+            h1 = (1.231 - ama * (1.63853 - 0.20667 * ama)) / (1 + 0.1451 * ama15)
+            h2 = (0.8889 - ama * (0.55063 - 0.50152 * ama)) / (1 + 0.14865 * ama15)
+            F2 = (h0 + h1 * ta2) / (1 + h2 * ta2)
+
+            # sky albedo
+            rs2 = (0.010191 + 0.00085547 * alph2 + AB2 * (0.14618 + 0.062758 * alph2) / (1 - 0.19402 * alph2)) / (
+                    1 + AB2 * (0.58101 + 0.17426 * alph2) / (1 - 0.17586 * alph2))
+
+            # irradiance BAND1 + BAND2
+            E0n1 = Eext * 0.46512
+            E0n2 = Eext * 0.51951
+            if numexpr is not None:
+                # numexpr blocks each expression into cache-sized chunks, so the
+                # ~10 intermediates per line below never materialize in full
+                Ebn1 = numexpr.evaluate('E0n1 * TR1 * Tg1 * To1 * Tn1 * Tw1 * TA1')
+                Edp1 = numexpr.evaluate('E0n1 * cos_z * To1 * Tg1 * Tn1166 * Tw1166 * ('
+                                        'BR1 * (1 - TR1) * sqrt(sqrt(TA1)) + Ba * F1 * TR1 * (1 - sqrt(sqrt(TAS1))))')
+                Edd1 = numexpr.evaluate('rg * rs1 * (Ebn1 * cos_z + Edp1) / (1 - rg * rs1)')
+                Ebn2 = numexpr.evaluate('E0n2 * TR2 * Tg2 * To2 * Tn2 * Tw2 * TA2')
+                Edp2 = numexpr.evaluate('E0n2 * cos_z * To2 * Tg2 * Tn2166 * Tw2166 * ('
+                                        'BR2 * (1 - TR2) * sqrt(sqrt(TA2)) + Ba * F2 * TR2 * (1 - sqrt(sqrt(TAS2))))')
+                Edd2 = numexpr.evaluate('rg * rs2 * (Ebn2 * cos_z + Edp2) / (1 - rg * rs2)')
+            else:
+                # direct beam irradiance
+                Ebn1 = E0n1 * TR1 * Tg1 * To1 * Tn1 * Tw1 * TA1
+                # the incident diffuse irradiance on a perfectly absorbing ground
+                Edp1 = E0n1 * cos_z * To1 * Tg1 * Tn1166 * Tw1166 * (
+                        BR1 * (1 - TR1) * np.sqrt(np.sqrt(TA1)) + Ba * F1 * TR1 * (1 - np.sqrt(np.sqrt(TAS1))))
+                # multiple reflections between the ground and the atmosphere
+                Edd1 = rg * rs1 * (Ebn1 * cos_z + Edp1) / (1 - rg * rs1)
+                # direct beam irradiance
+                Ebn2 = E0n2 * TR2 * Tg2 * To2 * Tn2 * Tw2 * TA2
+                # the incident diffuse irradiance on a perfectly absorbing ground
+                Edp2 = E0n2 * cos_z * To2 * Tg2 * Tn2166 * Tw2166 * (
+                        BR2 * (1 - TR2) * np.sqrt(np.sqrt(TA2)) + Ba * F2 * TR2 * (1 - np.sqrt(np.sqrt(TAS2))))
+                # multiple reflections between the ground and the atmosphere
+                Edd2 = rg * rs2 * (Ebn2 * cos_z + Edp2) / (1 - rg * rs2)
+            # TOTALS BAND1+BAND2
+            # correct for zenith angle with one shared horizon mask
+            horizon = z_deg > 90
+            # direct normal irradiance
+            np.add(Ebn1, Ebn2, out=dni)
+            dni[horizon] = 0
+            # diffuse horizontal irradiance
+            np.add(Edp1, Edd1, out=dhi)
+            dhi += Edp2
+            dhi += Edd2
+            dhi[horizon] = 0
+            # global horizontal irradiance (direct horizontal + diffuse)
+            np.multiply(dni, cos_z, out=ghi)
+            ghi += dhi
+
+            # Quality Control: clamp negatives in place (fmax also zeroes NaNs)
+            np.fmax(ghi, 0, out=ghi)
+            np.fmax(dni, 0, out=dni)
+            np.fmax(dhi, 0, out=dhi)
 
         return [ghi, dni, dhi]
     
@@ -278,31 +480,56 @@ class ClearSkyREST2v5:
         """
 
 
-        same_flag = 1
-
-        for i in range(len(self.time) - 1):
-            if self.time[i + 1].shape == self.time[0].shape:
-                if (self.time[i + 1] != self.time[0]).any():
-                    same_flag = 0
-            else:
-                same_flag = 0
+        # all stations share one time series when every series has the same
+        # shape and content; one stacked C-level comparison instead of a
+        # Python loop over stations
+        shapes = set(t.shape for t in self.time)
+        if len(shapes) == 1:
+            stacked_time = np.stack(self.time)
+            same_flag = 1 if np.all(stacked_time == stacked_time[0]) else 0
+        else:
+            same_flag = 0
 
         if same_flag == 1:
-            zenith_angle = latlon2solarzenith(self.lat, self.lon, self.time.T)
-            zenith_angle = np.deg2rad(zenith_angle)
-            Eext = data_eext_builder(self.time.T)
+            # solar geometry depends only on the (fixed) station coordinates
+            # and the time grid, so repeated runs over the same series reuse
+            # the zenith/Eext arrays from the previous call; the fingerprint
+            # is a few scalars rather than a full array comparison
+            t0 = np.ravel(self.time[0])
+            key = (id(self.time), t0[0], t0[-1], t0.size)
+            if self._geom_cache is not None and self._geom_cache[0] == key:
+                zenith_angle, Eext = self._geom_cache[1]
+            else:
+                zenith_angle = latlon2solarzenith(self.lat, self.lon, self.time.T)
+                zenith_angle = np.deg2rad(zenith_angle)
+                Eext = data_eext_builder(self.time.T)
+                self._geom_cache = (key, (zenith_angle, Eext))
 
             [tot_aer_ext, AOD550, Angstrom_exponent, ozone, surface_albedo, water_vapour, pressure,
              nitrogen_dioxide] =extract_for_MERRA2(self.lat, self.lon, self.time.T, self.elev, self.datadir)
 
-            [ghi, dni, dhi] = self.clear_sky_REST2V5(zenith_angle, Eext, pressure, water_vapour,ozone, nitrogen_dioxide, AOD550,Angstrom_exponent, surface_albedo)
+            # run the kernel over row chunks (~64MB per working array) so the
+            # intermediates never cover the whole (time, station) grid at once
+            ghi = np.empty(zenith_angle.shape, dtype=self.dtype)
+            dni = np.empty(zenith_angle.shape, dtype=self.dtype)
+            dhi = np.empty(zenith_angle.shape, dtype=self.dtype)
+            chunk = max(1, 64 * 1024 * 1024 // (self.dtype.itemsize * zenith_angle.shape[1]))
+            for start in range(0, zenith_angle.shape[0], chunk):
+                stop = start + chunk
+                self.clear_sky_REST2V5(
+                    zenith_angle[start:stop], Eext[start:stop], pressure[start:stop],
+                    water_vapour[start:stop], ozone[start:stop], nitrogen_dioxide[start:stop],
+                    AOD550[start:stop], Angstrom_exponent[start:stop], surface_albedo[start:stop],
+                    ghi=ghi[start:stop], dni=dni[start:stop], dhi=dhi[start:stop])
             if self.pandas_output:
                 col_index = ['GHI', 'DNI', 'DIF']
+                # one contiguous (station, time, component) block; every frame
+                # below is a no-copy view into it instead of a per-station hstack
+                stacked = np.stack((ghi.T, dni.T, dhi.T), axis=-1)
                 station_data_list = []
                 for index in range(len(self.time)):
-                    time_temp = (self.time[index]).reshape(self.time[index].size, 1)
-                    row_index = time_temp[:, 0]
-                    station_data = pd.DataFrame(np.hstack((ghi[:, index][:, np.newaxis], dni[:, index][:, np.newaxis], dhi[:, index][:, np.newaxis])), index=row_index, columns=col_index)
+                    row_index = np.ravel(self.time[index])
+                    station_data = pd.DataFrame(stacked[index], index=row_index, columns=col_index, copy=False)
                     station_data_list.append(station_data)
 
                 return station_data_list
@@ -315,6 +542,10 @@ class ClearSkyREST2v5:
                 return [ghi, dni, dhi]
 
         else:
+            # heterogeneous time series: the extractor assumes one shared
+            # time axis per call (it sizes and aligns its output from station
+            # 0's series), so each station gets its own geometry/extraction/
+            # kernel pass here
             ghi = []
             dni = []
             dhi = []
@@ -329,7 +560,8 @@ class ClearSkyREST2v5:
                 Eext = data_eext_builder(time_temp)
 
                 [tot_aer_ext, AOD550, Angstrom_exponent, ozone, surface_albedo, water_vapour, pressure,
-                 nitrogen_dioxide] = extract_for_MERRA2(self.lat[index], self.lon[index], time_temp, self.elev[index], self.datadir)
+                 nitrogen_dioxide] = extract_for_MERRA2(self.lat[index], self.lon[index], time_temp,
+                                                        self.elev[index], self.datadir)
 
                 [ghi_i, dni_i, dhi_i] = self.clear_sky_REST2V5(zenith_angle, Eext, pressure, water_vapour, ozone,
                                                          nitrogen_dioxide, AOD550, Angstrom_exponent, surface_albedo)
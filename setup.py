@@ -1,4 +1,5 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+from setuptools.command.build_ext import build_ext
 from setuptools.command.test import test
 from multiprocessing import freeze_support
 import os
@@ -25,6 +26,45 @@ def discover_and_run_tests():
     # run the test suite
     test_runner.run(test_suite)
 
+def build_ext_modules():
+    # optional compiled REST2 kernel; the model falls back to numba/NumPy
+    # when the extension is not built
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize([
+        Extension(
+            "irradpy.model._rest2_core",
+            ["irradpy/model/_rest2_core.pyx"],
+        )
+    ])
+
+
+class OptionalBuildExt(build_ext):
+    """Build the compiled REST2 kernel on a best-effort basis.
+
+    Compiler flags are chosen per toolchain (MSVC rejects the GCC style
+    flags, Apple clang ships without -fopenmp), and any failure to build
+    the extension is downgraded to a warning: the package is fully
+    functional without it through the numba/NumPy fallbacks.
+    """
+
+    def build_extension(self, ext):
+        if self.compiler.compiler_type == "msvc":
+            ext.extra_compile_args = ["/O2", "/openmp"]
+        else:
+            # no -ffast-math: the quality-control clamp relies on IEEE NaN
+            # comparison semantics to zero out invalid pixels
+            ext.extra_compile_args = ["-O3", "-fopenmp"]
+            ext.extra_link_args = ["-fopenmp"]
+        try:
+            build_ext.build_extension(self, ext)
+        except Exception as error:
+            print("WARNING: skipping optional extension %s (%s); "
+                  "irradpy will use the numba/NumPy code paths" % (ext.name, error))
+
+
 class DiscoverTest(test):
     def finalize_options(self):
         test.finalize_options(self)
@@ -51,6 +91,7 @@ if __name__ == "__main__":
         author_email = "jamiebright1@gmail.com",
 
         packages = find_packages(exclude=['test', 'util']),
+        ext_modules = build_ext_modules(),
         include_package_data = True,
         platforms = "any",
         install_requires = [
@@ -70,7 +111,7 @@ if __name__ == "__main__":
             ],
 
         scripts = [],
-        cmdclass = {'test': DiscoverTest},
+        cmdclass = {'test': DiscoverTest, 'build_ext': OptionalBuildExt},
         entry_points = {
             'console_scripts': [
                 'merra2_downloader = irradpy.downloader.socket:main'